@@ -1,299 +1,452 @@
-"""
-Smart Interview Bot - GUI (slide-by-slide)
-- Single-file Python app using tkinter (standard library)
-- Colorful, professional slides with Next / Previous navigation
-- Text-mode answers, keyword-based scoring, per-question feedback
-
-How to run:
-1. Save this file as `smart_interview_gui.py`.
-2. Run: `python smart_interview_gui.py` (requires Python 3.8+).
-
-Optional enhancements you can add later:
-- Speech input with `speech_recognition` and `pyaudio`
-- Better NLP scoring with `nltk` or an LLM API
-- Export results to PDF using `reportlab`
-
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox
-import random
-
-# --------------------------
-# Question bank
-# --------------------------
-TECHNICAL_QUESTIONS = [
-    {"q": "What is the difference between list and tuple in Python?", "keywords": ["mutable", "immutable"]},
-    {"q": "Explain the concept of inheritance in OOP.", "keywords": ["inheritance", "base class", "derived", "subclass"]},
-    {"q": "What is the time complexity of binary search?", "keywords": ["log", "logarithmic", "O(log n)"]},
-]
-
-HR_QUESTIONS = [
-    {"q": "Tell me about yourself.", "keywords": ["student", "experience", "project", "goal"]},
-    {"q": "What are your strengths and weaknesses?", "keywords": ["strength", "weakness", "learning"]},
-    {"q": "Where do you see yourself in 5 years?", "keywords": ["future", "goal", "career"]},
-]
-
-# Choose how many from each section
-NUM_TECH = 3
-NUM_HR = 2
-
-# --------------------------
-# Helpers
-# --------------------------
-
-def evaluate_answer(answer, keywords):
-    """Return matched_count and feedback string"""
-    ans = answer.lower()
-    matched = 0
-    matched_words = []
-    for kw in keywords:
-        if kw.lower() in ans:
-            matched += 1
-            matched_words.append(kw)
-
-    if matched == 0:
-        fb = "Needs improvement — missing important points."
-    elif matched < len(keywords):
-        fb = "Good — some important points present, add more details."
-    else:
-        fb = "Excellent — covered expected points!"
-
-    return matched, fb, matched_words
-
-# --------------------------
-# Main App
-# --------------------------
-
-class Slide(tk.Frame):
-    def __init__(self, master, title="", subtitle="", bg="#ffffff"):
-        super().__init__(master, bg=bg)
-        self.title = title
-        self.subtitle = subtitle
-        self.bg = bg
-        self._build()
-
-    def _build(self):
-        # Title
-        self.lbl_title = tk.Label(self, text=self.title, font=("Segoe UI", 20, "bold"), bg=self.bg)
-        self.lbl_title.pack(pady=(20, 6))
-        # Subtitle
-        self.lbl_sub = tk.Label(self, text=self.subtitle, font=("Segoe UI", 11), bg=self.bg, wraplength=760, justify="center")
-        self.lbl_sub.pack(pady=(0, 10))
-
-
-class QuestionSlide(Slide):
-    def __init__(self, master, question_data, index, total, bg):
-        super().__init__(master, title=f"Question {index}/{total}", subtitle=question_data['q'], bg=bg)
-        self.question_data = question_data
-        self.index = index
-        self.total = total
-        self._build_question_area()
-
-    def _build_question_area(self):
-        # Text entry for answer
-        self.txt = tk.Text(self, height=8, width=90, font=("Segoe UI", 10))
-        self.txt.pack(pady=(10, 6))
-
-        # Feedback label
-        self.fb_var = tk.StringVar(value="")
-        self.lbl_fb = tk.Label(self, textvariable=self.fb_var, font=("Segoe UI", 10, "italic"), bg=self.bg)
-        self.lbl_fb.pack(pady=(6, 6))
-
-        # Small hint area to show matched keywords (hidden initially)
-        self.hint_var = tk.StringVar(value="")
-        self.lbl_hint = tk.Label(self, textvariable=self.hint_var, font=("Segoe UI", 9), bg=self.bg)
-        self.lbl_hint.pack(pady=(2, 10))
-
-    def get_answer(self):
-        return self.txt.get("1.0", tk.END).strip()
-
-    def set_feedback(self, text):
-        self.fb_var.set(text)
-
-    def set_hint(self, text):
-        self.hint_var.set(text)
-
-
-class SummarySlide(Slide):
-    def __init__(self, master, summary_text, bg="#f7f7f7"):
-        super().__init__(master, title="Interview Summary", subtitle=summary_text, bg=bg)
-        self._build_summary()
-
-    def _build_summary(self):
-        self.lbl_more = tk.Label(self, text="(Use the buttons below to finish or restart)", bg=self.bg, font=("Segoe UI", 9))
-        self.lbl_more.pack(pady=(10, 6))
-
-
-class SmartInterviewApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Smart Interview Bot")
-        self.geometry("820x560")
-        self.resizable(False, False)
-
-        # Style
-        self.style = ttk.Style(self)
-        try:
-            self.style.theme_use('clam')
-        except Exception:
-            pass
-
-        # Color palette
-        self.colors = ["#0b6e4f", "#f08a24", "#0d6efd", "#6f42c1", "#198754"]
-
-        # Header area
-        self.header = tk.Frame(self, bg=self.colors[2], height=70)
-        self.header.pack(fill=tk.X)
-        self._build_header()
-
-        # Container for slides
-        self.container = tk.Frame(self, bg="#ffffff")
-        self.container.pack(fill=tk.BOTH, expand=True)
-
-        # Footer navigation
-        self.footer = tk.Frame(self, bg="#f0f0f0", height=70)
-        self.footer.pack(fill=tk.X)
-        self._build_footer()
-
-        # Prepare interview
-        self._prepare_questions()
-        self.current_idx = 0
-        self.slides = []
-        self.answers = [""] * len(self.questions)
-        self.scores = [0] * len(self.questions)
-
-        self._build_slides()
-        self._show_slide(0)
-
-    def _build_header(self):
-        logo = tk.Label(self.header, text="Smart Interview Bot", font=("Segoe UI", 16, "bold"), bg=self.colors[2], fg="white")
-        logo.pack(side=tk.LEFT, padx=20)
-
-        self.progress_var = tk.DoubleVar(value=0)
-        self.progress = ttk.Progressbar(self.header, orient='horizontal', length=300, mode='determinate', variable=self.progress_var)
-        self.progress.pack(side=tk.RIGHT, padx=20)
-
-    def _build_footer(self):
-        self.btn_prev = ttk.Button(self.footer, text="◀ Previous", command=self.prev_slide)
-        self.btn_prev.pack(side=tk.LEFT, padx=18, pady=12)
-
-        self.btn_next = ttk.Button(self.footer, text="Next ▶", command=self.next_slide)
-        self.btn_next.pack(side=tk.RIGHT, padx=18, pady=12)
-
-        self.btn_submit = ttk.Button(self.footer, text="Submit Answer & Eval", command=self.evaluate_current)
-        self.btn_submit.pack(side=tk.RIGHT, padx=12, pady=12)
-
-    def _prepare_questions(self):
-        tech_sample = random.sample(TECHNICAL_QUESTIONS, min(NUM_TECH, len(TECHNICAL_QUESTIONS)))
-        hr_sample = random.sample(HR_QUESTIONS, min(NUM_HR, len(HR_QUESTIONS)))
-        # Interleave tech and hr questions for variety
-        combined = []
-        for i in range(max(len(tech_sample), len(hr_sample))):
-            if i < len(tech_sample):
-                combined.append(("Technical", tech_sample[i]))
-            if i < len(hr_sample):
-                combined.append(("HR", hr_sample[i]))
-
-        self.questions = combined
-
-    def _build_slides(self):
-        total = len(self.questions)
-        for idx, (sect, qdata) in enumerate(self.questions, start=1):
-            color = self.colors[idx % len(self.colors)]
-            slide = QuestionSlide(self.container, question_data=qdata, index=idx, total=total, bg=color)
-            slide.place(relwidth=1, relheight=1)
-            self.slides.append(slide)
-
-        # Summary slide appended at the end
-        self.summary_slide = SummarySlide(self.container, summary_text="Your detailed summary will appear here.")
-        self.summary_slide.place(relwidth=1, relheight=1)
-
-    def _show_slide(self, idx):
-        # idx is 0-based. last index is summary
-        for s in self.slides:
-            s.lower()
-        self.summary_slide.lower()
-
-        if idx < len(self.slides):
-            self.slides[idx].lift()
-        else:
-            self.summary_slide.lift()
-
-        # Update progress
-        percent = (idx / (len(self.slides))) * 100
-        self.progress_var.set(percent)
-
-        # Update nav buttons
-        self.btn_prev['state'] = tk.NORMAL if idx > 0 else tk.DISABLED
-        self.btn_next['state'] = tk.NORMAL if idx < len(self.slides) else tk.DISABLED
-
-        self.current_idx = idx
-
-    def evaluate_current(self):
-        if self.current_idx >= len(self.slides):
-            return
-
-        slide = self.slides[self.current_idx]
-        ans = slide.get_answer()
-        self.answers[self.current_idx] = ans
-        matched, feedback, matched_words = evaluate_answer(ans, slide.question_data['keywords'])
-        self.scores[self.current_idx] = matched
-        slide.set_feedback(feedback)
-        if matched_words:
-            slide.set_hint("Matched keywords: " + ", ".join(matched_words))
-        else:
-            slide.set_hint("")
-
-        messagebox.showinfo("Evaluation", f"Feedback:\n{feedback}")
-
-    def next_slide(self):
-        # Auto-evaluate before moving on
-        self.evaluate_current()
-        if self.current_idx < len(self.slides) - 1:
-            self._show_slide(self.current_idx + 1)
-        else:
-            # Move to summary
-            self._show_summary()
-
-    def prev_slide(self):
-        if self.current_idx > 0:
-            self._show_slide(self.current_idx - 1)
-
-    def _show_summary(self):
-        # Build a summary string
-        total_keywords = sum(len(q[1]['keywords']) for q in self.questions)
-        total_score = sum(self.scores)
-        section_wise = {}
-        for i, (sect, qdata) in enumerate(self.questions):
-            section_wise.setdefault(sect, {'score': 0, 'possible': 0})
-            section_wise[sect]['score'] += self.scores[i]
-            section_wise[sect]['possible'] += len(qdata['keywords'])
-
-        lines = [f"Total Score: {total_score} / {total_keywords}", ""]
-        for sect, vals in section_wise.items():
-            lines.append(f"{sect} Score: {vals['score']} / {vals['possible']}")
-        lines.append("")
-        lines.append("Detailed answers and feedback:")
-
-        for i, (sect, qdata) in enumerate(self.questions):
-            ans = self.answers[i].strip() or "(No answer)"
-            matched = self.scores[i]
-            possible = len(qdata['keywords'])
-            lines.append(f"Q{i+1} ({sect}): {qdata['q']}")
-            lines.append(f"  Your answer: {ans}")
-            lines.append(f"  Score: {matched} / {possible}")
-            lines.append("")
-
-        summary_text = "\n".join(lines)
-        # Put text into summary slide subtitle area
-        self.summary_slide.lbl_sub.config(text=summary_text)
-        self._show_slide(len(self.slides))
-
-
-# --------------------------
-# Run
-# --------------------------
-if __name__ == '__main__':
-    app = SmartInterviewApp()
-    app.mainloop()
+"""
+Smart Interview Bot - GUI (slide-by-slide)
+- Single-file Python app using tkinter (standard library)
+- Colorful, professional slides with Next / Previous navigation
+- Text-mode answers, keyword-based scoring, per-question feedback
+
+How to run:
+1. Save this file as `smart_interview_gui.py`.
+2. Run: `python smart_interview_gui.py` (requires Python 3.8+).
+
+Optional enhancements you can add later:
+- Speech input with `speech_recognition` and `pyaudio`
+- Better NLP scoring with `nltk` or an LLM API
+- Export results to PDF using `reportlab`
+
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import random
+
+# Optional: pyahocorasick gives single-pass keyword scanning; the app falls
+# back to per-question matching when it isn't installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# --------------------------
+# Question bank
+# --------------------------
+TECHNICAL_QUESTIONS = [
+    {"q": "What is the difference between list and tuple in Python?", "keywords": ["mutable", "immutable"]},
+    {"q": "Explain the concept of inheritance in OOP.", "keywords": ["inheritance", "base class", "derived", "subclass"]},
+    {"q": "What is the time complexity of binary search?", "keywords": ["log", "logarithmic", "O(log n)"]},
+]
+
+HR_QUESTIONS = [
+    {"q": "Tell me about yourself.", "keywords": ["student", "experience", "project", "goal"]},
+    {"q": "What are your strengths and weaknesses?", "keywords": ["strength", "weakness", "learning"]},
+    {"q": "Where do you see yourself in 5 years?", "keywords": ["future", "goal", "career"]},
+]
+
+# Choose how many from each section
+NUM_TECH = 3
+NUM_HR = 2
+
+# The sample sizes and bank sizes are constants, so the interleaved
+# (section, sample-index) order is computed once at import time
+_TECH_N = min(NUM_TECH, len(TECHNICAL_QUESTIONS))
+_HR_N = min(NUM_HR, len(HR_QUESTIONS))
+_INTERLEAVE = tuple(
+    (sect, i)
+    for i in range(max(_TECH_N, _HR_N))
+    for sect, n in (("Technical", _TECH_N), ("HR", _HR_N))
+    if i < n
+)
+
+# Pre-lowercase keywords once at import time so evaluate_answer doesn't
+# re-lowercase them on every submission. The fallback scorer works on byte
+# strings: bytes.find is a tight C loop over uint8, with half the memory
+# traffic of scanning UCS-2/UCS-4 str storage.
+for qid, q in enumerate(TECHNICAL_QUESTIONS + HR_QUESTIONS):
+    q["qid"] = qid
+    q["n_keywords"] = len(q["keywords"])
+    q["keywords_lc"] = tuple(k.lower() for k in q["keywords"])
+    q["kw_bytes"] = tuple(k.encode("ascii", errors="ignore") for k in q["keywords_lc"])
+
+# Build one Aho-Corasick automaton over every keyword of every question so a
+# submission is scored in a single linear scan of the answer. Keywords shared
+# by several questions map to the set of owning qids.
+if ahocorasick is not None:
+    _AC = ahocorasick.Automaton()
+    _owners = {}
+    for q in TECHNICAL_QUESTIONS + HR_QUESTIONS:
+        for kw_lc in q["keywords_lc"]:
+            _owners.setdefault(kw_lc, set()).add(q["qid"])
+    for kw_lc, owners in _owners.items():
+        _AC.add_word(kw_lc, (kw_lc, frozenset(owners)))
+    _AC.make_automaton()
+    del _owners
+else:
+    _AC = None
+
+# --------------------------
+# UI constants
+# --------------------------
+# Font tuples hoisted to module level so slide construction doesn't
+# rebuild them per widget
+FONT_HEADER = ("Segoe UI", 16, "bold")
+FONT_TITLE = ("Segoe UI", 20, "bold")
+FONT_BODY = ("Segoe UI", 11)
+FONT_ANS = ("Segoe UI", 10)
+FONT_FB = ("Segoe UI", 10, "italic")
+FONT_HINT = ("Segoe UI", 9)
+
+# --------------------------
+# Helpers
+# --------------------------
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+def evaluate_answer(answer, question_data):
+    """Return match bitmask (bit i = keyword i matched), feedback string and matched words"""
+    # A question without keywords would otherwise fall into the "Excellent"
+    # branch with zero matches
+    if not question_data["n_keywords"]:
+        return 0, "No scoring criteria.", []
+
+    mask = 0
+    if _AC is not None:
+        # Single pass over the answer; keep only matches owned by this question
+        ans = answer.lower()
+        qid = question_data["qid"]
+        hits = {kw for _, (kw, owners) in _AC.iter(ans) if qid in owners}
+        for i, lc in enumerate(question_data["keywords_lc"]):
+            if lc in hits:
+                mask |= 1 << i
+    else:
+        # Encode once and scan bytes: hits CPython's optimized stringlib
+        # substring search instead of walking Unicode code points. Dropped
+        # non-ASCII characters become b"?" boundaries so they can't splice
+        # their neighbours into a keyword; keywords are pure ASCII, so the
+        # replacement cannot create false positives.
+        ab = answer.encode("ascii", errors="replace").lower()
+        for i, kb in enumerate(question_data["kw_bytes"]):
+            if kb in ab:
+                mask |= 1 << i
+
+    matched = _popcount(mask)
+    matched_words = [kw for i, kw in enumerate(question_data["keywords"]) if mask >> i & 1]
+
+    if matched == 0:
+        fb = "Needs improvement — missing important points."
+    elif matched < question_data["n_keywords"]:
+        fb = "Good — some important points present, add more details."
+    else:
+        fb = "Excellent — covered expected points!"
+
+    return mask, fb, matched_words
+
+# --------------------------
+# Main App
+# --------------------------
+
+class Slide(tk.Frame):
+    def __init__(self, master, title="", subtitle="", bg="#ffffff"):
+        super().__init__(master, bg=bg)
+        self.title = title
+        self.subtitle = subtitle
+        self.bg = bg
+        self._build()
+
+    def _build(self):
+        # Title
+        self.lbl_title = tk.Label(self, text=self.title, font=FONT_TITLE, bg=self.bg)
+        self.lbl_title.pack(pady=(20, 6))
+        # Subtitle
+        self.lbl_sub = tk.Label(self, text=self.subtitle, font=FONT_BODY, bg=self.bg, wraplength=760, justify="center")
+        self.lbl_sub.pack(pady=(0, 10))
+
+
+class QuestionSlide(Slide):
+    def __init__(self, master, question_data, index, total, bg):
+        super().__init__(master, title=f"Question {index}/{total}", subtitle=question_data['q'], bg=bg)
+        self.question_data = question_data
+        self.index = index
+        self.total = total
+        # Answer text lives in the app's single shared Text widget; each
+        # slide only caches its own content between visits
+        self.answer_cache = ""
+        self._build_question_area()
+
+    def _build_question_area(self):
+        # Feedback and hint sit at the bottom; the middle of the slide is
+        # left free for the shared answer widget
+        self.hint_var = tk.StringVar(value="")
+        self.lbl_hint = tk.Label(self, textvariable=self.hint_var, font=FONT_HINT, bg=self.bg)
+        self.lbl_hint.pack(side=tk.BOTTOM, pady=(2, 10))
+
+        self.fb_var = tk.StringVar(value="")
+        self.lbl_fb = tk.Label(self, textvariable=self.fb_var, font=FONT_FB, bg=self.bg)
+        self.lbl_fb.pack(side=tk.BOTTOM, pady=(6, 6))
+
+    def set_feedback(self, text):
+        self.fb_var.set(text)
+
+    def set_hint(self, text):
+        self.hint_var.set(text)
+
+
+class SummarySlide(Slide):
+    def __init__(self, master, summary_text, bg="#f7f7f7"):
+        super().__init__(master, title="Interview Summary", subtitle=summary_text, bg=bg)
+        self._build_summary()
+
+    def _build_summary(self):
+        # Read-only Text widget with a scrollbar; a wrapped Label re-measures
+        # the whole summary on every redraw
+        self.txt = tk.Text(self, wrap=tk.WORD, font=FONT_ANS, state=tk.DISABLED)
+        sb = tk.Scrollbar(self, command=self.txt.yview)
+        self.txt.config(yscrollcommand=sb.set)
+        sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.txt.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 6))
+
+        self.lbl_more = tk.Label(self, text="(Use the buttons below to finish or restart)", bg=self.bg, font=FONT_HINT)
+        self.lbl_more.pack(pady=(4, 6))
+
+    def set_summary(self, text):
+        self.txt.config(state=tk.NORMAL)
+        self.txt.delete("1.0", tk.END)
+        self.txt.insert(tk.END, text)
+        self.txt.config(state=tk.DISABLED)
+
+
+class SmartInterviewApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Smart Interview Bot")
+        self.geometry("820x560")
+        self.resizable(False, False)
+
+        # Style
+        self.style = ttk.Style(self)
+        try:
+            self.style.theme_use('clam')
+        except Exception:
+            pass
+
+        # Color palette
+        self.colors = ["#0b6e4f", "#f08a24", "#0d6efd", "#6f42c1", "#198754"]
+
+        # Header area
+        self.header = tk.Frame(self, bg=self.colors[2], height=70)
+        self.header.pack(fill=tk.X)
+        self._build_header()
+
+        # Container for slides
+        self.container = tk.Frame(self, bg="#ffffff")
+        self.container.pack(fill=tk.BOTH, expand=True)
+
+        # One Text widget is shared by every question slide; only one slide
+        # is visible at a time, so per-slide Text widgets would just churn
+        # Tcl objects. Live feedback is rescored on typing, debounced so
+        # scoring stays off the keystroke critical path.
+        self.shared_answer = tk.Text(self.container, height=8, width=90, font=FONT_ANS)
+        self.shared_answer.bind('<KeyRelease>', self._on_key)
+        self._pending = None
+
+        # Footer navigation
+        self.footer = tk.Frame(self, bg="#f0f0f0", height=70)
+        self.footer.pack(fill=tk.X)
+        self._build_footer()
+
+        # Prepare interview
+        self._prepare_questions()
+        self.current_idx = 0
+        self.slides = []
+        self._visible = None
+        self._last_pct = -1
+        self.answers = [""] * len(self.questions)
+        # Keyword-match bitmask per question; plain ints so the masks are
+        # unbounded (array.array('i') would cap a question at 31 keywords)
+        self.scores = [0] * len(self.questions)
+        # Answer text as of the last evaluation, used to skip redundant re-scoring
+        self._last_evaluated = [None] * len(self.questions)
+
+        self._build_slides()
+        self._show_slide(0)
+
+    def _build_header(self):
+        logo = tk.Label(self.header, text="Smart Interview Bot", font=FONT_HEADER, bg=self.colors[2], fg="white")
+        logo.pack(side=tk.LEFT, padx=20)
+
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress = ttk.Progressbar(self.header, orient='horizontal', length=300, mode='determinate', variable=self.progress_var)
+        self.progress.pack(side=tk.RIGHT, padx=20)
+
+    def _build_footer(self):
+        self.btn_prev = ttk.Button(self.footer, text="◀ Previous", command=self.prev_slide)
+        self.btn_prev.pack(side=tk.LEFT, padx=18, pady=12)
+
+        self.btn_next = ttk.Button(self.footer, text="Next ▶", command=self.next_slide)
+        self.btn_next.pack(side=tk.RIGHT, padx=18, pady=12)
+
+        self.btn_submit = ttk.Button(self.footer, text="Submit Answer & Eval", command=self.evaluate_current)
+        self.btn_submit.pack(side=tk.RIGHT, padx=12, pady=12)
+
+    def _prepare_questions(self):
+        tech_sample = random.sample(TECHNICAL_QUESTIONS, _TECH_N)
+        hr_sample = random.sample(HR_QUESTIONS, _HR_N)
+        # Tech and hr questions are interleaved for variety; the order
+        # pattern itself is the precomputed _INTERLEAVE constant
+        self.questions = [
+            (sect, (tech_sample if sect == "Technical" else hr_sample)[i])
+            for sect, i in _INTERLEAVE
+        ]
+        # Fixed section ids (0 = Technical, 1 = HR) for the summary tally
+        self.sections = [0 if sect == "Technical" else 1 for sect, _ in _INTERLEAVE]
+
+    def _build_slides(self):
+        # Slides are built lazily in _show_slide; creating every Text/Label
+        # up front dominates startup time
+        self.slides = [None] * len(self.questions)
+
+        # Summary slide is built on demand in _ensure_summary
+        self.summary_slide = None
+
+    def _ensure_summary(self):
+        if self.summary_slide is None:
+            self.summary_slide = SummarySlide(self.container, summary_text="")
+        return self.summary_slide
+
+    def _ensure_slide(self, idx):
+        if self.slides[idx] is None:
+            sect, qdata = self.questions[idx]
+            color = self.colors[(idx + 1) % len(self.colors)]
+            self.slides[idx] = QuestionSlide(self.container, question_data=qdata, index=idx + 1, total=len(self.questions), bg=color)
+        return self.slides[idx]
+
+    def _show_slide(self, idx):
+        # idx is 0-based. last index is summary
+        if idx < len(self.slides):
+            target = self._ensure_slide(idx)
+        else:
+            target = self._ensure_summary()
+
+        # Save the outgoing answer, then swap only the two frames involved
+        # instead of restacking every slide
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        if self._visible is not None:
+            if self._visible is not self.summary_slide:
+                self._visible.answer_cache = self._read_answer()
+            self._visible.place_forget()
+        target.place(relwidth=1, relheight=1)
+
+        # Point the shared answer widget at the incoming slide's cache
+        if idx < len(self.slides):
+            self.shared_answer.delete("1.0", tk.END)
+            self.shared_answer.insert(tk.END, target.answer_cache)
+            self.shared_answer.place(relx=0.5, rely=0.28, anchor='n')
+            self.shared_answer.lift()
+        else:
+            self.shared_answer.place_forget()
+        self._visible = target
+
+        # Update progress, skipping the Tcl variable write (and the
+        # Progressbar redraw it triggers) when the percentage is unchanged
+        pct = int(idx * 100 / len(self.slides))
+        if pct != self._last_pct:
+            self.progress_var.set(pct)
+            self._last_pct = pct
+
+        # Update nav buttons
+        self.btn_prev['state'] = tk.NORMAL if idx > 0 else tk.DISABLED
+        self.btn_next['state'] = tk.NORMAL if idx < len(self.slides) else tk.DISABLED
+
+        self.current_idx = idx
+
+    def _read_answer(self):
+        return self.shared_answer.get("1.0", tk.END).strip()
+
+    def _on_key(self, event=None):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(150, self._rescore)
+
+    def _rescore(self):
+        self._pending = None
+        self.evaluate_current()
+
+    def evaluate_current(self):
+        if self.current_idx >= len(self.slides):
+            return
+
+        slide = self.slides[self.current_idx]
+        ans = self._read_answer()
+        slide.answer_cache = ans
+        self.answers[self.current_idx] = ans
+        mask, feedback, matched_words = evaluate_answer(ans, slide.question_data)
+        self.scores[self.current_idx] = mask
+        self._last_evaluated[self.current_idx] = ans
+        slide.set_feedback(feedback)
+        if matched_words:
+            slide.set_hint("Matched keywords: " + ", ".join(matched_words))
+        else:
+            slide.set_hint("")
+
+    def next_slide(self):
+        # Auto-evaluate before moving on, but only if the answer changed
+        # since the last evaluation
+        slide = self.slides[self.current_idx] if self.current_idx < len(self.slides) else None
+        if slide is not None and self._read_answer() != self._last_evaluated[self.current_idx]:
+            self.evaluate_current()
+        if self.current_idx < len(self.slides) - 1:
+            self._show_slide(self.current_idx + 1)
+        else:
+            # Move to summary
+            self._show_summary()
+
+    def prev_slide(self):
+        if self.current_idx > 0:
+            self._show_slide(self.current_idx - 1)
+
+    def _show_summary(self):
+        # Build a summary string; compute keyword counts once and assemble
+        # everything with a single join
+        possibles = [q[1]['n_keywords'] for q in self.questions]
+        total_keywords = sum(possibles)
+        # Sections are the fixed pair {Technical, HR}, so tally into two
+        # index-addressed accumulators instead of a dict. Scores are stored
+        # as keyword bitmasks; popcount turns them back into counts.
+        sec_score = [0, 0]
+        sec_poss = [0, 0]
+        for sec, mask, possible in zip(self.sections, self.scores, possibles):
+            sec_score[sec] += _popcount(mask)
+            sec_poss[sec] += possible
+        total_score = sec_score[0] + sec_score[1]
+
+        header = [
+            f"Total Score: {total_score} / {total_keywords}",
+            "",
+            f"Technical Score: {sec_score[0]} / {sec_poss[0]}",
+            f"HR Score: {sec_score[1]} / {sec_poss[1]}",
+            "",
+            "Detailed answers and feedback:",
+        ]
+
+        detail = [
+            f"Q{i+1} ({sect}): {qdata['q']}\n  Your answer: {ans.strip() or '(No answer)'}\n  Score: {_popcount(mask)} / {possible}\n"
+            for i, ((sect, qdata), ans, mask, possible) in enumerate(zip(self.questions, self.answers, self.scores, possibles))
+        ]
+
+        summary_text = "\n".join(header + detail)
+        # Put text into the summary slide's scrollable text area
+        self._ensure_summary().set_summary(summary_text)
+        self._show_slide(len(self.slides))
+
+
+# --------------------------
+# Run
+# --------------------------
+if __name__ == '__main__':
+    app = SmartInterviewApp()
+    app.mainloop()
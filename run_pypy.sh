@@ -0,0 +1,5 @@
+#!/bin/sh
+# Launch the interview bot under PyPy. PyPy's JIT speeds up the Python-level
+# event dispatch and Tcl call marshalling that dominate the GUI loop, and
+# tkinter ships with PyPy, so no extra dependencies are needed.
+exec pypy3 interview.py "$@"
@@ -0,0 +1,90 @@
+"""
+Smart Interview Bot - optional batch scoring kernel
+- Compiled scorer for re-evaluating prerecorded transcripts offline,
+  where `evaluate_answer` becomes the hot loop
+- Keywords are packed once into a flat byte table; each answer is scored
+  as a byte array, returning a bitmask of matched keywords
+- Requires `numba` and `numpy`; both are optional — without them a
+  pure-Python fallback with identical results is used
+- Keywords must encode to non-empty ASCII (build_keyword_table raises
+  ValueError otherwise); non-ASCII characters in answers are replaced
+  with b"?" so they act as match boundaries rather than vanishing
+
+Usage:
+    from scoring_kernel import build_keyword_table, score_answer
+    table = build_keyword_table([k.lower() for k in keywords])
+    mask = score_answer("the answer text", table)
+
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def build_keyword_table(keywords):
+    """Pack lowercase keywords into a flat (offsets, data) byte table.
+
+    Raises ValueError for keywords that encode to empty ASCII: an empty
+    needle would match every answer in one scorer and none in the other.
+    Also limited to 63 keywords so the mask fits the njit path's int64;
+    beyond that the shift would wrap while the fallback stayed unbounded.
+    """
+    if len(keywords) > 63:
+        raise ValueError(f"at most 63 keywords per table, got {len(keywords)}")
+    encoded = [k.encode("ascii", errors="ignore") for k in keywords]
+    for kw, b in zip(keywords, encoded):
+        if not b:
+            raise ValueError(f"keyword {kw!r} encodes to empty ASCII")
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    data = b"".join(encoded)
+    if HAVE_NUMBA:
+        return np.asarray(offsets, dtype=np.int64), np.frombuffer(data, dtype=np.uint8)
+    return offsets, data
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _contains(hay, needle):
+        n = len(needle)
+        if n == 0:
+            return False
+        for i in range(len(hay) - n + 1):
+            for j in range(n):
+                if hay[i + j] != needle[j]:
+                    break
+            else:
+                return True
+        return False
+
+    @njit(cache=True)
+    def _score(ans, offsets, data):
+        out = 0
+        for i in range(len(offsets) - 1):
+            if _contains(ans, data[offsets[i]:offsets[i + 1]]):
+                out |= 1 << i
+        return out
+
+    def score_answer(answer, table):
+        """Return a bitmask with bit i set if keyword i occurs in answer."""
+        offsets, data = table
+        ans = np.frombuffer(answer.lower().encode("ascii", errors="replace"), dtype=np.uint8)
+        return int(_score(ans, offsets, data))
+
+else:
+
+    def score_answer(answer, table):
+        """Return a bitmask with bit i set if keyword i occurs in answer."""
+        offsets, data = table
+        ans = answer.lower().encode("ascii", errors="replace")
+        out = 0
+        for i in range(len(offsets) - 1):
+            if data[offsets[i]:offsets[i + 1]] in ans:
+                out |= 1 << i
+        return out